@@ -256,3 +256,10 @@ class Step(StrictBaseModel):
 
     spec: StepSpec
     config: StepConfiguration
+
+    class Config:
+        """Pydantic config class."""
+
+        # Steps are immutable, so other models can share the same instance
+        # instead of copying it when they get validated.
+        copy_on_model_validation = "none"
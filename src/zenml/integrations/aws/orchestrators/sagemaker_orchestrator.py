@@ -164,10 +164,10 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
 
         session = sagemaker.Session(default_bucket=self.config.bucket)
 
+        command = StepEntrypointConfiguration.get_entrypoint_command()
         sagemaker_steps = []
         for step_name, step in deployment.step_configurations.items():
             image = self.get_image(deployment=deployment, step_name=step_name)
-            command = StepEntrypointConfiguration.get_entrypoint_command()
             arguments = StepEntrypointConfiguration.get_entrypoint_arguments(
                 step_name=step_name, deployment_id=deployment.id
             )
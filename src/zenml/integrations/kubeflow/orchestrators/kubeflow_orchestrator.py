@@ -532,6 +532,10 @@ class KubeflowOrchestrator(ContainerizedOrchestrator):
             method of a KFPCompiler all dsl.ContainerOp instances will be
             automatically added to a singular dsl.Pipeline instance.
             """
+            # The command will be needed to eventually call the python step
+            # within the docker container
+            command = StepEntrypointConfiguration.get_entrypoint_command()
+
             # Dictionary of container_ops index by the associated step name
             step_name_to_container_op: Dict[str, dsl.ContainerOp] = {}
 
@@ -540,10 +544,6 @@ class KubeflowOrchestrator(ContainerizedOrchestrator):
                     deployment=deployment, step_name=step_name
                 )
 
-                # The command will be needed to eventually call the python step
-                # within the docker container
-                command = StepEntrypointConfiguration.get_entrypoint_command()
-
                 # The arguments are passed to configure the entrypoint of the
                 # docker container when the step is called.
                 arguments = (
@@ -390,6 +390,8 @@ class TektonOrchestrator(ContainerizedOrchestrator):
             Additionally, this gives each container_op information about its
             direct downstream steps.
             """
+            command = StepEntrypointConfiguration.get_entrypoint_command()
+
             # Dictionary of container_ops index by the associated step name
             step_name_to_container_op: Dict[str, dsl.ContainerOp] = {}
 
@@ -398,7 +400,6 @@ class TektonOrchestrator(ContainerizedOrchestrator):
                     deployment=deployment, step_name=step_name
                 )
 
-                command = StepEntrypointConfiguration.get_entrypoint_command()
                 arguments = (
                     StepEntrypointConfiguration.get_entrypoint_arguments(
                         step_name=step_name, deployment_id=deployment.id
@@ -82,6 +82,10 @@ class BaseMaterializerMeta(type):
                     url="https://docs.zenml.io/user-guide/advanced-guide/handle-custom-data-types",
                 )
 
+        # Normalize associated data types so subclasses which declare them as
+        # a list are stored as an immutable tuple.
+        cls.ASSOCIATED_TYPES = tuple(cls.ASSOCIATED_TYPES)
+
         # Validate associated data types.
         for associated_type in cls.ASSOCIATED_TYPES:
             if not inspect.isclass(associated_type):
@@ -92,10 +96,9 @@ class BaseMaterializerMeta(type):
                 )
 
         # Register the materializer.
+        register = materializer_registry.register_materializer_type
         for associated_type in cls.ASSOCIATED_TYPES:
-            materializer_registry.register_materializer_type(
-                associated_type, cls
-            )
+            register(associated_type, cls)
 
         return cls
 
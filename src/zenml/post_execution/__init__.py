@@ -19,28 +19,85 @@ interfaces with which the user can interact with artifacts, the pipeline, steps,
 and the post-run pipeline object.
 """
 
-from zenml.post_execution.artifact import ArtifactView
-from zenml.post_execution.lineage import (
-    ArtifactNode,
-    ArtifactNodeDetails,
-    BaseNode,
-    Edge,
-    LineageGraph,
-    StepNode,
-    StepNodeDetails,
-)
-from zenml.post_execution.pipeline import (
-    PipelineVersionView,
-    PipelineView,
-    get_pipeline,
-    get_pipelines,
-)
-from zenml.post_execution.pipeline_run import (
-    PipelineRunView,
-    get_run,
-    get_unlisted_runs,
-)
-from zenml.post_execution.step import StepView
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from zenml.post_execution.artifact import ArtifactView
+    from zenml.post_execution.lineage import (
+        ArtifactNode,
+        ArtifactNodeDetails,
+        BaseNode,
+        Edge,
+        LineageGraph,
+        StepNode,
+        StepNodeDetails,
+    )
+    from zenml.post_execution.pipeline import (
+        PipelineVersionView,
+        PipelineView,
+        get_pipeline,
+        get_pipelines,
+    )
+    from zenml.post_execution.pipeline_run import (
+        PipelineRunView,
+        get_run,
+        get_unlisted_runs,
+    )
+    from zenml.post_execution.step import StepView
+
+# The submodules are only imported once one of their attributes is accessed
+# (PEP 562), so importing this package does not pull in the lineage graph
+# and all views upfront.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "ArtifactView": "zenml.post_execution.artifact",
+    "ArtifactNode": "zenml.post_execution.lineage",
+    "ArtifactNodeDetails": "zenml.post_execution.lineage",
+    "BaseNode": "zenml.post_execution.lineage",
+    "Edge": "zenml.post_execution.lineage",
+    "LineageGraph": "zenml.post_execution.lineage",
+    "StepNode": "zenml.post_execution.lineage",
+    "StepNodeDetails": "zenml.post_execution.lineage",
+    "PipelineVersionView": "zenml.post_execution.pipeline",
+    "PipelineView": "zenml.post_execution.pipeline",
+    "get_pipeline": "zenml.post_execution.pipeline",
+    "get_pipelines": "zenml.post_execution.pipeline",
+    "PipelineRunView": "zenml.post_execution.pipeline_run",
+    "get_run": "zenml.post_execution.pipeline_run",
+    "get_unlisted_runs": "zenml.post_execution.pipeline_run",
+    "StepView": "zenml.post_execution.step",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily imports the public attributes of this package.
+
+    Args:
+        name: Name of the attribute to import.
+
+    Returns:
+        The imported attribute.
+
+    Raises:
+        AttributeError: If the package has no attribute with the given name.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Lists the attributes of this package, including lazily loaded ones.
+
+    Returns:
+        The names of the attributes.
+    """
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "PipelineVersionView",
@@ -0,0 +1,76 @@
+"""Add step run indexes [5e3c2a1f9d47].
+
+Revision ID: 5e3c2a1f9d47
+Revises: 0.40.3
+Create Date: 2026-10-15 10:12:41.503218
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5e3c2a1f9d47"
+down_revision = "0.40.3"
+branch_labels = None
+depends_on = None
+
+
+def _is_sqlite() -> bool:
+    """Checks whether the migration runs against a SQLite database.
+
+    MySQL already keeps an index for every foreign key column that isn't the
+    leading column of another index, so the indexes would only duplicate it.
+    Once an explicit index exists, MySQL also drops its implicit one, which
+    would make the explicit index impossible to drop again on downgrade.
+
+    Returns:
+        Whether the database is a SQLite database.
+    """
+    return op.get_bind().engine.name == "sqlite"
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    if not _is_sqlite():
+        return
+
+    with op.batch_alter_table("step_run_parents", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_step_run_parents_child_id", ["child_id"], unique=False
+        )
+
+    with op.batch_alter_table(
+        "step_run_input_artifact", schema=None
+    ) as batch_op:
+        batch_op.create_index(
+            "ix_step_run_input_artifact_artifact_id",
+            ["artifact_id"],
+            unique=False,
+        )
+
+    with op.batch_alter_table(
+        "step_run_output_artifact", schema=None
+    ) as batch_op:
+        batch_op.create_index(
+            "ix_step_run_output_artifact_artifact_id",
+            ["artifact_id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    if not _is_sqlite():
+        return
+
+    with op.batch_alter_table(
+        "step_run_output_artifact", schema=None
+    ) as batch_op:
+        batch_op.drop_index("ix_step_run_output_artifact_artifact_id")
+
+    with op.batch_alter_table(
+        "step_run_input_artifact", schema=None
+    ) as batch_op:
+        batch_op.drop_index("ix_step_run_input_artifact_artifact_id")
+
+    with op.batch_alter_table("step_run_parents", schema=None) as batch_op:
+        batch_op.drop_index("ix_step_run_parents_child_id")
@@ -0,0 +1,28 @@
+"""Add step run cache key index [8b1f4d6e2c90].
+
+Revision ID: 8b1f4d6e2c90
+Revises: 5e3c2a1f9d47
+Create Date: 2026-10-15 13:47:05.218734
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8b1f4d6e2c90"
+down_revision = "5e3c2a1f9d47"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_step_run_cache_key", ["cache_key"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.drop_index("ix_step_run_cache_key")
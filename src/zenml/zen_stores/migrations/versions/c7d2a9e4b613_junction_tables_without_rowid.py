@@ -0,0 +1,51 @@
+"""Junction tables without rowid [c7d2a9e4b613].
+
+Revision ID: c7d2a9e4b613
+Revises: 8b1f4d6e2c90
+Create Date: 2026-10-15 14:32:18.904127
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c7d2a9e4b613"
+down_revision = "8b1f4d6e2c90"
+branch_labels = None
+depends_on = None
+
+_JUNCTION_TABLES = (
+    "step_run_parents",
+    "step_run_input_artifact",
+    "step_run_output_artifact",
+)
+
+
+def _recreate_junction_tables(with_rowid: bool) -> None:
+    """Recreates the step run junction tables on SQLite.
+
+    `WITHOUT ROWID` is a SQLite-only table option that can't be changed on an
+    existing table, so the tables need to be copied into new ones. This is a
+    no-op for all other databases.
+
+    Args:
+        with_rowid: Whether the recreated tables should have a rowid.
+    """
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    table_kwargs = {} if with_rowid else {"sqlite_with_rowid": False}
+    for table_name in _JUNCTION_TABLES:
+        with op.batch_alter_table(
+            table_name, recreate="always", table_kwargs=table_kwargs
+        ):
+            pass
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    _recreate_junction_tables(with_rowid=False)
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    _recreate_junction_tables(with_rowid=True)
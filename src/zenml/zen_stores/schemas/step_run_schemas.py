@@ -13,13 +13,17 @@
 #  permissions and limitations under the License.
 """SQLModel implementation of step run tables."""
 
+import dataclasses
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List, Optional
+from functools import lru_cache
+from operator import methodcaller
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 from uuid import UUID
 
-from pydantic.json import pydantic_encoder
-from sqlalchemy import TEXT, Column, String
+from pydantic import BaseModel
+from pydantic.json import ENCODERS_BY_TYPE, pydantic_encoder
+from sqlalchemy import TEXT, Column, Index, String
 from sqlalchemy.dialects.mysql import MEDIUMTEXT
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -44,11 +48,54 @@ if TYPE_CHECKING:
     from zenml.zen_stores.schemas.logs_schemas import LogsSchema
     from zenml.zen_stores.schemas.run_metadata_schemas import RunMetadataSchema
 
+# Only the caching parameters of a step run are stored with sorted keys, so
+# that equal parameters always serialize to the same string. The `parameters`
+# and `step_configuration` columns are only ever parsed back into objects, so
+# their key order doesn't matter.
+
+
+@lru_cache(maxsize=64)
+def _encoder_for(type_: type) -> Callable[[Any], Any]:
+    """Resolves the JSON encoder for a type.
+
+    Mirrors the lookup done by `pydantic_encoder`, but only once per type.
+
+    Args:
+        type_: The type for which to resolve the encoder.
+
+    Returns:
+        The encoder for instances of the type. For types that can't be
+        encoded, this is `pydantic_encoder` which raises a `TypeError`.
+    """
+    if issubclass(type_, BaseModel):
+        return methodcaller("dict")
+    if dataclasses.is_dataclass(type_):
+        return dataclasses.asdict
+    for base in type_.__mro__[:-1]:
+        encoder = ENCODERS_BY_TYPE.get(base)
+        if encoder is not None:
+            return encoder
+    return pydantic_encoder
+
+
+def _json_default(obj: Any) -> Any:
+    """Encodes objects that `json` can't serialize natively.
+
+    Args:
+        obj: The object to encode.
+
+    Returns:
+        A JSON serializable representation of the object.
+    """
+    obj_type: type = type(obj)
+    return _encoder_for(obj_type)(obj)
+
 
 class StepRunSchema(NamedSchema, table=True):
     """SQL Model for steps of pipeline runs."""
 
     __tablename__ = "step_run"
+    __table_args__ = (Index("ix_step_run_cache_key", "cache_key"),)
 
     pipeline_run_id: UUID = build_foreign_key_field(
         source=__tablename__,
@@ -160,6 +207,11 @@ class StepRunSchema(NamedSchema, table=True):
             The step run schema.
         """
         step_config = request.step.config
+        # Convert the step to a dict only once and serialize all JSON columns
+        # from it instead of traversing the nested config models again.
+        step_dict = request.step.dict()
+        config_dict = step_dict["config"]
+        caching_parameters = config_dict["caching_parameters"]
         return cls(
             name=request.name,
             pipeline_run_id=request.pipeline_run_id,
@@ -168,22 +220,18 @@ class StepRunSchema(NamedSchema, table=True):
             user_id=request.user,
             enable_cache=step_config.enable_cache,
             enable_artifact_metadata=step_config.enable_artifact_metadata,
-            code_hash=step_config.caching_parameters.get(
-                STEP_SOURCE_PARAMETER_NAME
-            ),
+            code_hash=caching_parameters.get(STEP_SOURCE_PARAMETER_NAME),
             cache_key=request.cache_key,
             start_time=request.start_time,
             end_time=request.end_time,
             entrypoint_name=step_config.name,
             parameters=json.dumps(
-                step_config.parameters,
-                default=pydantic_encoder,
-                sort_keys=True,
+                config_dict["parameters"], default=_json_default
             ),
-            step_configuration=request.step.json(sort_keys=True),
+            step_configuration=json.dumps(step_dict, default=_json_default),
             caching_parameters=json.dumps(
-                step_config.caching_parameters,
-                default=pydantic_encoder,
+                caching_parameters,
+                default=_json_default,
                 sort_keys=True,
             ),
             docstring=request.docstring,
@@ -212,7 +260,9 @@ class StepRunSchema(NamedSchema, table=True):
             metadata_schema.key: metadata_schema.to_model()
             for metadata_schema in self.run_metadata
         }
-        return StepRunResponseModel(
+        # All values were validated before they were written to the database,
+        # so we skip the validation when constructing the response model.
+        return StepRunResponseModel.construct(
             id=self.id,
             name=self.name,
             pipeline_run_id=self.pipeline_run_id,
@@ -224,7 +274,7 @@ class StepRunSchema(NamedSchema, table=True):
             start_time=self.start_time,
             end_time=self.end_time,
             step=Step.parse_raw(self.step_configuration),
-            status=self.status,
+            status=ExecutionStatus(self.status),
             docstring=self.docstring,
             source_code=self.source_code,
             created=self.created,
@@ -244,13 +294,10 @@ class StepRunSchema(NamedSchema, table=True):
         Returns:
             The updated step run schema.
         """
-        for key, value in step_update.dict(
-            exclude_unset=True, exclude_none=True
-        ).items():
-            if key == "status":
-                self.status = value
-            if key == "end_time":
-                self.end_time = value
+        if step_update.status is not None:
+            self.status = step_update.status
+        if step_update.end_time is not None:
+            self.end_time = step_update.end_time
 
         self.updated = datetime.utcnow()
 
@@ -261,6 +308,13 @@ class StepRunParentsSchema(SQLModel, table=True):
     """SQL Model that defines the order of steps."""
 
     __tablename__ = "step_run_parents"
+    # The table only stores its composite primary key, so SQLite can use it
+    # as the clustered key instead of keeping a separate rowid.
+    __table_args__ = (
+        # Only created on SQLite, MySQL indexes foreign keys implicitly.
+        Index("ix_step_run_parents_child_id", "child_id"),
+        {"sqlite_with_rowid": False},
+    )
 
     parent_id: UUID = build_foreign_key_field(
         source=__tablename__,
@@ -298,6 +352,13 @@ class StepRunInputArtifactSchema(SQLModel, table=True):
     """SQL Model that defines which artifacts are inputs to which step."""
 
     __tablename__ = "step_run_input_artifact"
+    # Every column is part of the composite primary key, so SQLite can use it
+    # as the clustered key instead of keeping a separate rowid.
+    __table_args__ = (
+        # Only created on SQLite, MySQL indexes foreign keys implicitly.
+        Index("ix_step_run_input_artifact_artifact_id", "artifact_id"),
+        {"sqlite_with_rowid": False},
+    )
 
     step_id: UUID = build_foreign_key_field(
         source=__tablename__,
@@ -328,6 +389,14 @@ class StepRunOutputArtifactSchema(SQLModel, table=True):
     """SQL Model that defines which artifacts are outputs of which step."""
 
     __tablename__ = "step_run_output_artifact"
+    # Besides its composite primary key, the table only stores the small
+    # `name` column, so SQLite can cluster the rows on that key instead of
+    # keeping a separate rowid.
+    __table_args__ = (
+        # Only created on SQLite, MySQL indexes foreign keys implicitly.
+        Index("ix_step_run_output_artifact_artifact_id", "artifact_id"),
+        {"sqlite_with_rowid": False},
+    )
 
     step_id: UUID = build_foreign_key_field(
         source=__tablename__,
@@ -19,6 +19,7 @@ import logging
 import math
 import os
 import re
+from collections import defaultdict
 from contextvars import ContextVar
 from pathlib import Path, PurePath
 from typing import (
@@ -718,6 +719,9 @@ class SqlZenStore(BaseZenStore):
                 List[AnySchema],
             ]
         ] = None,
+        custom_schemas_to_models_conversion: Optional[
+            Callable[[List[AnySchema]], List[B]]
+        ] = None,
     ) -> Page[B]:
         """Given a query, return a Page instance with a list of filtered Models.
 
@@ -736,6 +740,11 @@ class SqlZenStore(BaseZenStore):
                 perform additional filtering). The callable should take a
                 `Session`, a `Select` query and a `BaseFilterModel` filter as
                 arguments and return a `List` of items.
+            custom_schemas_to_models_conversion: Callable to convert all
+                schemas of the page into models at once. This is used instead
+                of `custom_schema_to_model_conversion` if the additional data
+                the Model contains can be fetched for all items of the page
+                with a single query.
 
         Returns:
             The Domain Model representation of the DB resource
@@ -796,21 +805,24 @@ class SqlZenStore(BaseZenStore):
 
         # Convert this page of items from schemas to models.
         items: List[B] = []
-        for schema in item_schemas:
-            # If a custom conversion function is provided, use it.
-            if custom_schema_to_model_conversion:
-                items.append(custom_schema_to_model_conversion(schema))
-                continue
-            # Otherwise, try to use the `to_model` method of the schema.
-            to_model = getattr(schema, "to_model", None)
-            if callable(to_model):
-                items.append(to_model())
-                continue
-            # If neither of the above work, raise an error.
-            raise RuntimeError(
-                f"Cannot convert schema `{schema.__class__.__name__}` to model "
-                "since it does not have a `to_model` method."
-            )
+        if custom_schemas_to_models_conversion:
+            items = custom_schemas_to_models_conversion(item_schemas)
+        else:
+            for schema in item_schemas:
+                # If a custom conversion function is provided, use it.
+                if custom_schema_to_model_conversion:
+                    items.append(custom_schema_to_model_conversion(schema))
+                    continue
+                # Otherwise, try to use the `to_model` method of the schema.
+                to_model = getattr(schema, "to_model", None)
+                if callable(to_model):
+                    items.append(to_model())
+                    continue
+                # If neither of the above work, raise an error.
+                raise RuntimeError(
+                    f"Cannot convert schema `{schema.__class__.__name__}` to "
+                    "model since it does not have a `to_model` method."
+                )
 
         return Page(
             total=total,
@@ -3698,54 +3710,102 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The run step model.
         """
+        return self._run_step_schemas_to_models([step_run])[0]
+
+    def _run_step_schemas_to_models(
+        self, step_runs: List[StepRunSchema]
+    ) -> List[StepRunResponseModel]:
+        """Converts run step schemas to step models.
+
+        The parent steps and input/output artifacts of all step runs are
+        fetched with a single query each instead of separate queries per
+        step run.
+
+        Args:
+            step_runs: The run step schemas to convert.
+
+        Returns:
+            The run step models, in the same order as the schemas.
+        """
+        if not step_runs:
+            return []
+
+        step_run_ids = [step_run.id for step_run in step_runs]
+        parent_step_ids: Dict[UUID, List[UUID]] = defaultdict(list)
+        input_artifacts: Dict[
+            UUID, Dict[str, ArtifactResponseModel]
+        ] = defaultdict(dict)
+        output_artifacts: Dict[
+            UUID, Dict[str, ArtifactResponseModel]
+        ] = defaultdict(dict)
+
         with Session(self.engine) as session:
             # Get parent steps.
-            parent_steps = session.exec(
-                select(StepRunSchema)
-                .where(StepRunParentsSchema.child_id == step_run.id)
-                .where(StepRunParentsSchema.parent_id == StepRunSchema.id)
+            parents = session.exec(
+                select(
+                    StepRunParentsSchema.child_id,
+                    StepRunParentsSchema.parent_id,
+                ).where(
+                    StepRunParentsSchema.child_id.in_(  # type: ignore[attr-defined]
+                        step_run_ids
+                    )
+                )
             ).all()
-            parent_step_ids = [parent_step.id for parent_step in parent_steps]
+            for child_id, parent_id in parents:
+                parent_step_ids[child_id].append(parent_id)
 
             # Get input artifacts.
             input_artifact_list = session.exec(
                 select(
                     ArtifactSchema,
+                    StepRunInputArtifactSchema.step_id,
                     StepRunInputArtifactSchema.name,
                 )
                 .where(
                     ArtifactSchema.id == StepRunInputArtifactSchema.artifact_id
                 )
-                .where(StepRunInputArtifactSchema.step_id == step_run.id)
+                .where(
+                    StepRunInputArtifactSchema.step_id.in_(  # type: ignore[attr-defined]
+                        step_run_ids
+                    )
+                )
             ).all()
-            input_artifacts = {
-                input_name: self._artifact_schema_to_model(artifact)
-                for (artifact, input_name) in input_artifact_list
-            }
+            for artifact, step_id, input_name in input_artifact_list:
+                input_artifacts[step_id][
+                    input_name
+                ] = self._artifact_schema_to_model(artifact)
 
             # Get output artifacts.
             output_artifact_list = session.exec(
                 select(
                     ArtifactSchema,
+                    StepRunOutputArtifactSchema.step_id,
                     StepRunOutputArtifactSchema.name,
                 )
                 .where(
                     ArtifactSchema.id
                     == StepRunOutputArtifactSchema.artifact_id
                 )
-                .where(StepRunOutputArtifactSchema.step_id == step_run.id)
+                .where(
+                    StepRunOutputArtifactSchema.step_id.in_(  # type: ignore[attr-defined]
+                        step_run_ids
+                    )
+                )
             ).all()
-            output_artifacts = {
-                output_name: self._artifact_schema_to_model(artifact)
-                for (artifact, output_name) in output_artifact_list
-            }
-
-            # Convert to model.
-            return step_run.to_model(
-                parent_step_ids=parent_step_ids,
-                input_artifacts=input_artifacts,
-                output_artifacts=output_artifacts,
-            )
+            for artifact, step_id, output_name in output_artifact_list:
+                output_artifacts[step_id][
+                    output_name
+                ] = self._artifact_schema_to_model(artifact)
+
+            # Convert to models.
+            return [
+                step_run.to_model(
+                    parent_step_ids=parent_step_ids[step_run.id],
+                    input_artifacts=input_artifacts[step_run.id],
+                    output_artifacts=output_artifacts[step_run.id],
+                )
+                for step_run in step_runs
+            ]
 
     def list_run_steps(
         self, step_run_filter_model: StepRunFilterModel
@@ -3766,7 +3826,7 @@ class SqlZenStore(BaseZenStore):
                 query=query,
                 table=StepRunSchema,
                 filter_model=step_run_filter_model,
-                custom_schema_to_model_conversion=self._run_step_schema_to_model,
+                custom_schemas_to_models_conversion=self._run_step_schemas_to_models,
             )
 
     def update_run_step(
@@ -38,7 +38,12 @@ from tests.unit.pipelines.test_build_utils import (
     StubLocalRepositoryContext,
 )
 from zenml.client import Client
-from zenml.enums import SecretScope, StackComponentType, StoreType
+from zenml.enums import (
+    ExecutionStatus,
+    SecretScope,
+    StackComponentType,
+    StoreType,
+)
 from zenml.exceptions import (
     DoesNotExistException,
     EntityExistsError,
@@ -1095,6 +1100,52 @@ def test_get_run_step_inputs_succeeds():
             assert len(run_step_inputs) == 1
 
 
+def test_run_step_status_is_execution_status():
+    """Tests that fetched step runs have an `ExecutionStatus` status."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(1):
+        steps = store.list_run_steps(StepRunFilterModel()).items
+        assert steps
+        for step in steps:
+            assert isinstance(step.status, ExecutionStatus)
+            assert isinstance(
+                store.get_run_step(step.id).status, ExecutionStatus
+            )
+
+
+def test_list_run_steps_includes_parents_and_artifacts():
+    """Tests listing run steps returns the links of each individual step."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(2) as runs:
+        steps = store.list_run_steps(StepRunFilterModel()).items
+        for run in runs:
+            run_steps = {
+                step.name: step
+                for step in steps
+                if step.pipeline_run_id == run.id
+            }
+            upstream_step = run_steps["step_1"]
+            downstream_step = run_steps["step_2"]
+
+            assert upstream_step.parent_step_ids == []
+            assert upstream_step.input_artifacts == {}
+            assert downstream_step.parent_step_ids == [upstream_step.id]
+            assert (
+                downstream_step.input_artifacts["input"].id
+                == upstream_step.output_artifacts["output"].id
+            )
+
+        for step in steps:
+            fetched_step = store.get_run_step(step.id)
+            assert step.parent_step_ids == fetched_step.parent_step_ids
+            assert step.input_artifacts == fetched_step.input_artifacts
+            assert step.output_artifacts == fetched_step.output_artifacts
+
+
 # .-----------.
 # | Artifacts |
 # '-----------'
@@ -54,6 +54,15 @@ def test_materializer_raises_an_exception_if_associated_artifact_type_wrong():
             ASSOCIATED_ARTIFACT_TYPE = "not_an_artifact_type"
 
 
+def test_materializer_associated_types_are_stored_as_tuple():
+    """Tests that associated types declared as a list are stored as tuple."""
+
+    class ListMaterializer(BaseMaterializer):
+        ASSOCIATED_TYPES = [int, float]
+
+    assert ListMaterializer.ASSOCIATED_TYPES == (int, float)
+
+
 def test_validate_type_compatibility():
     """Unit test for `BaseMaterializer.validate_type_compatibility`."""
     materializer = TestMaterializer(uri="")
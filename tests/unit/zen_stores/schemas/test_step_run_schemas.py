@@ -0,0 +1,46 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import json
+import math
+from pathlib import Path
+
+from zenml.config.step_configurations import Step
+from zenml.zen_stores.schemas import StepRunSchema, WorkspaceSchema
+
+
+def test_step_run_schema_json_columns_round_trip(sample_step_request_model):
+    """Tests that step parameters survive storing and loading a step run."""
+    step_dict = sample_step_request_model.step.dict()
+    step_dict["config"]["parameters"] = {
+        "big_int": 2**70,
+        "nan": float("nan"),
+        "inf": float("inf"),
+        "set": {1},
+        "path": Path("/some/path"),
+    }
+    sample_step_request_model.step = Step.parse_obj(step_dict)
+
+    schema = StepRunSchema.from_request(sample_step_request_model)
+    schema.workspace = WorkspaceSchema(name="workspace", description="")
+
+    for parameters in (
+        json.loads(schema.parameters),
+        schema.to_model([], {}, {}).step.config.parameters,
+    ):
+        assert parameters["big_int"] == 2**70
+        assert math.isnan(parameters["nan"])
+        assert parameters["inf"] == float("inf")
+        assert parameters["set"] == [1]
+        assert parameters["path"] == "/some/path"